@@ -1,94 +1,83 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import streamlit as st
 import json
-from geopy.geocoders import Nominatim
-import pandas as pd
-import time
 from urllib.parse import urljoin
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import hashlib
+import diskcache
+import orjson
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+# Successful predictions are kept on disk for a day so restarts start warm
+DISK_CACHE_EXPIRE = 24 * 60 * 60
+
+# (connect, read) timeouts; Render cold starts are slow to answer a prediction
+PREDICT_TIMEOUT = (3, 30)
+STATUS_TIMEOUT = (3, 5)
+# How long the page waits on the background status probe before drawing the banner
+STATUS_JOIN_TIMEOUT = 5
+
+LIST_TYPE = ("Apartment", "House")
+LIST_APT = (
+    'Apartment', 'Flat Studio', 'Duplex', 'Penthouse', 'Ground Floor',
+    'Apartment Block', 'Kot', 'Exceptional Property', 'Mixed Use Building',
+    'Triplex', 'Loft', 'Service Flat'
+)
+LIST_HOUSE = (
+    'House', 'Villa', 'Town House', 'Chalet', 'Manor House', 'Mansion',
+    'Bungalow', 'Country Cottage', 'Other Property', 'Castle', 'Pavilion',
+    'Exceptional Property'
+)
+SUBTYPES = {"Apartment": LIST_APT, "House": LIST_HOUSE}
+PROVINCES = (
+    'Brussels', 'Luxembourg', 'Antwerp', 'Flemish Brabant', 'East Flanders', 'West Flanders',
+    'Liège', 'Walloon Brabant', 'Limburg', 'Namur', 'Hainaut'
+)
+# API province names are the display names without spaces
+PROVINCE_DISPLAY = {province.replace(" ", ""): province for province in PROVINCES}
+EPC_SCORES = ("A+", "A", "B", "C", "D", "E", "F", "G")
+# Payload fields the API cannot predict without
+REQUIRED_FIELDS = ("type", "subtype", "province", "postCode", "epcScore", "habitableSurface")
+# (API key, checkbox label) pairs for the extra features
+BOOLEAN_FIELDS = (
+    ("hasAttic", "Attic"),
+    ("hasGarden", "Garden"),
+    ("hasAirConditioning", "Air Conditioning"),
+    ("hasArmoredDoor", "Armored Door"),
+    ("hasVisiophone", "Visiophone"),
+    ("hasTerrace", "Terrace"),
+    ("hasOffice", "Office"),
+    ("hasSwimmingPool", "Swimming Pool"),
+    ("hasFireplace", "Fireplace"),
+    ("hasBasement", "Basement"),
+    ("hasDressingRoom", "Dressing Room"),
+    ("hasDiningRoom", "Dining Room"),
+    ("hasLift", "Lift"),
+    ("hasHeatPump", "Heat Pump"),
+    ("hasPhotovoltaicPanels", "Photovoltaic Panels"),
+    ("hasLivingRoom", "Living Room"),
+)
 
 st.set_page_config(
     page_title="Property Price Predictor",
     page_icon="🏠",
     layout="wide",
-    initial_sidebar_state="expanded",
+    initial_sidebar_state="collapsed",
 )
 
-st.markdown(
-    """
-<style>
-:root, [data-theme="light"]{
-    --primary-color: black;
-    --bg-color:  #f8f9faBB;
-}
- [data-theme="dark"] {
-    --primary-color: white;
-    --bg-color: #0E1117;
-  }
-    .main-header {
-        text-align: center;
-        padding: 36px 0;
-        background: linear-gradient(90deg, #FF4B4B 0%, #764ba2 100%);
-        color: white;
-        border-radius: 10px;
-        margin-bottom: 32px;
-    }
-    
-    .status-container {
-        display: flex;
-        justify-content: center;
-        margin-bottom: 32px;
-    }
-    
-    .status-good {
-        background-color: #d4edda;
-        border: 1px solid #c3e6cb;
-        color: #155724;
-        padding: 12px 20px;
-        border-radius: 4px;
-    }
-    
-    .status-error {
-        background-color: #f8d7da;
-        border: 1px solid #f5c6cb;
-        color: #721c24;
-        padding: 12px 20px;
-        border-radius: 4px;
-    }
-    
-    .prediction-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 32px;
-        border-radius: 15px;
-        color: white;
-        text-align: center;
-        margin: 32px; 0;
-        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-    }
-    
-    .feature-tag {
-        display: inline-block;
-        background-color: #e3f2fd;
-        color: #1976d2;
-        padding: 4px 12px;
-        border-radius: 20px;
-        margin: 4px;
-        font-size: 14px;
-    }
-    
-    .info-card {
-        background-color: var(--bg-color);
-        color: var(--primary-color);
-        border-left: 6px solid #764ba2;
-        padding: 16px;
-        margin: 6px 0;
-        border-radius: 0 10px 10px 0;
-    }
-</style>
-""",
-    unsafe_allow_html=True,
-)
+
+@st.cache_resource
+def load_css():
+    """Read the page stylesheet once per process"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.join(base_dir, "assets", "styles.css"), encoding="utf-8") as f:
+        return f"<style>\n{f.read()}</style>"
 
 
 def format_for_display(text):
@@ -104,20 +93,40 @@ def format_for_api(text):
     return text.replace(' ', '_').upper()
 
 
+@st.cache_resource(show_spinner=False)
 def load_geodata():
+    """Map each postcode to the mean [lat, lon] of its sub-municipalities
+
+    postcodes.json is precomputed from georef-belgium-postal-codes.csv by
+    averaging the "Geo Point" of every row sharing a "Post code".
+    """
     base_dir = os.path.dirname(os.path.abspath(__file__))
-    data_path = os.path.join(base_dir, "data", "georef-belgium-postal-codes.csv")
-    geo_df = pd.read_csv(data_path, delimiter=";")
-    geo_df[["lat", "lon"]] = geo_df["Geo Point"].str.split(",", expand=True)
-    geo_df["lat"] = geo_df["lat"].astype(float)
-    geo_df["lon"] = geo_df["lon"].astype(float)
-    geo_df["postCode"] = geo_df["Post code"].astype(str)
-    grouped_df = geo_df.groupby("postCode")[["lat", "lon"]].mean()
-    return grouped_df
+    data_path = os.path.join(base_dir, "data", "postcodes.json")
+    with open(data_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@st.cache_resource
+def get_session():
+    """Shared HTTP session so API calls reuse pooled keep-alive connections"""
+    # Only the idempotent status GET is retried; a failed prediction is reported as-is
+    retry = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    # Streamlit sessions and executor workers share this pool, so keep
+    # enough connections to the backend host that none are discarded
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session = requests.Session()
+    session.mount(st.secrets["predict_api"]["base_url"], adapter)
+    return session
 
 
 def check_missing_fields(input):
-    missing = [k for k, v in input.items() if v is None]
+    missing = [k for k in REQUIRED_FIELDS if not input.get(k)]
     if missing:
         for field in missing:
             st.error(f"❌ Missing value for: {field}")
@@ -125,43 +134,138 @@ def check_missing_fields(input):
     return True
 
 
+@st.cache_resource
+def get_executor():
+    """Worker pool for the server status probe, which runs while the form renders"""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+# Failures of the best-effort disk cache: unwritable or full disk, locked database
+DISK_CACHE_ERRORS = (OSError, sqlite3.Error, diskcache.Timeout)
+
+
+@st.cache_resource
+def get_disk_cache():
+    """Prediction store that survives process restarts, or None if unavailable"""
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    try:
+        return diskcache.Cache(os.path.join(base_dir, ".cache"))
+    except DISK_CACHE_ERRORS:
+        logger.warning("Disk cache unavailable, predictions won't persist", exc_info=True)
+        return None
+
+
+def read_disk_cache(key):
+    """Return the stored prediction for key, or None on a miss or disk error"""
+    disk_cache = get_disk_cache()
+    if disk_cache is None:
+        return None
+    try:
+        return disk_cache.get(key)
+    except DISK_CACHE_ERRORS:
+        logger.warning("Disk cache read failed", exc_info=True)
+        return None
+
+
+def write_disk_cache(key, value):
+    """Store a prediction on disk; failures are logged and otherwise ignored"""
+    disk_cache = get_disk_cache()
+    if disk_cache is None:
+        return
+    try:
+        disk_cache.set(key, value, expire=DISK_CACHE_EXPIRE)
+    except DISK_CACHE_ERRORS:
+        logger.warning("Disk cache write failed", exc_info=True)
+
+
+def extract_price(body):
+    """Return the predicted price from a 200 response body, or None if malformed"""
+    data = body.get("data") if isinstance(body, dict) else None
+    price = data.get("prediction") if isinstance(data, dict) else None
+    if isinstance(price, (int, float)) and not isinstance(price, bool):
+        return price
+    return None
+
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def fetch_prediction(payload_json, url, model_version):
+    """POST a serialized payload to the predict API, memoized per payload
+
+    url and model_version are part of both the memo and the disk cache key,
+    so a new endpoint or a retrained model never serves stale predictions.
+    """
+    digest = hashlib.blake2b(f"{url}|{model_version}|".encode(), digest_size=16)
+    digest.update(payload_json)
+    key = digest.hexdigest()
+    cached = read_disk_cache(key)
+    if cached is not None:
+        return cached
+
+    response = get_session().post(
+        url,
+        data=payload_json,
+        headers={"Content-Type": "application/json"},
+        timeout=PREDICT_TIMEOUT,
+    )
+    try:
+        body = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        body = response.text
+    if response.status_code == 200 and extract_price(body) is not None:
+        write_disk_cache(key, (response.status_code, body))
+    return response.status_code, body
+
+
 def predict_price(data):
     if check_missing_fields(data):
-        url = urljoin(
-        st.secrets["predict_api"]["base_url"],
-        st.secrets["predict_api"]["predict_endpoint"],)
-      
         payload = {"data": data}
-        print(payload)
-        response = requests.post(url, json=payload)
-        return response
+        logger.debug("predict payload=%s", payload)
+        # One compact encode serves as both the cache key and the request body
+        payload_json = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        url = urljoin(
+            st.secrets["predict_api"]["base_url"],
+            st.secrets["predict_api"]["predict_endpoint"],
+        )
+        model_version = st.secrets["predict_api"].get("model_version", "")
+        status_code, body = fetch_prediction(payload_json, url, model_version)
+        # Only a valid prediction or a validation error is deterministic for a
+        # payload; anything else (429, 404 during redeploys, 5xx) may pass
+        deterministic = status_code == 422 or (
+            status_code == 200 and extract_price(body) is not None
+        )
+        if not deterministic:
+            fetch_prediction.clear(payload_json, url, model_version)
+        return status_code, body
     else:
         st.warning("Please fill in all required fields.")
+        return None, None
 
 def get_location(postcode):
-    """Get location coordinates from address query"""
+    """Get location coordinates for a postcode"""
+    if not postcode:
+        return None, None
     try:
-        geo_df = load_geodata()
-        postcode =str(postcode)
-        if postcode in geo_df.index:
-            lat, lon = geo_df.loc[postcode]
-            return lat, lon
-        else:
-            st.warning(f"⚠️ Postcode {postcode} not found in database")
-            return None, None
-    except Exception as e:
+        coords = load_geodata().get(str(postcode))
+    except (OSError, ValueError) as e:
         st.error(f"❌ Error getting location: {str(e)}")
         return None, None
-       
+    if coords is None:
+        st.warning(f"⚠️ Postcode {postcode} not found in database")
+        return None, None
+    return coords
 
 
+@st.cache_data(ttl=30, show_spinner=False)
 def check_server_status():
     """Check if the API server is running"""
     try:
         url = st.secrets["predict_api"]["base_url"]
-        response = requests.get(url, timeout=5)
-        return response.json().get("message", "Unknown"), True
-    except requests.exceptions.RequestException:
+        response = get_session().get(url, timeout=STATUS_TIMEOUT)
+        response.raise_for_status()
+        body = response.json()
+        message = body.get("message", "Unknown") if isinstance(body, dict) else "Unknown"
+        return message, True
+    except (requests.exceptions.RequestException, ValueError):
         return "Connection Error", False
 
 
@@ -170,25 +274,31 @@ def format_currency(amount):
     return f"€{amount:,.2f}"
 
 
+def info_card(label, value):
+    """Format one labelled line of the property summary"""
+    return f'<div class="info-card"><strong>{label}:</strong> {value}</div>'
+
+
 def create_property_summary(property_data):
-    """Create a formatted summary of the property"""
-    summary = {}
+    """Create the property summary as a single block of info cards"""
+    parts = []
 
     if property_data["type"] and property_data["subtype"]:
-        property_data["type"] = format_for_display(property_data["type"])
-        property_data["subtype"] =  format_for_display(property_data["subtype"])
-        summary["Property Type"] = (
-            f"{property_data['type']} - {property_data['subtype']}"
-        )
+        property_type = format_for_display(property_data["type"])
+        subtype = format_for_display(property_data["subtype"])
+        parts.append(info_card("Property Type", f"{property_type} - {subtype}"))
 
     if property_data["province"]:
-        summary["Province"] = re.sub(r'(?<=[a-z])(?=[A-Z])', ' ', property_data["province"])
+        province = PROVINCE_DISPLAY.get(
+            property_data["province"], property_data["province"]
+        )
+        parts.append(info_card("Province", province))
 
     if property_data["postCode"]:
-        summary["Postcode"] = str(property_data["postCode"])
+        parts.append(info_card("Postcode", property_data["postCode"]))
 
     if property_data["epcScore"]:
-        summary["EPC Score"] = property_data["epcScore"]
+        parts.append(info_card("EPC Score", property_data["epcScore"]))
 
     # Surface information
     surfaces = []
@@ -200,7 +310,7 @@ def create_property_summary(property_data):
         surfaces.append(f"Garden: {property_data['gardenSurface']} m²")
 
     if surfaces:
-        summary["Surface Areas"] = " | ".join(surfaces)
+        parts.append(info_card("Surface Areas", " | ".join(surfaces)))
 
     # Room counts
     rooms = []
@@ -212,43 +322,65 @@ def create_property_summary(property_data):
         rooms.append(f"{property_data['toiletCount']} toilets")
 
     if rooms:
-        summary["Rooms"] = " | ".join(rooms)
+        parts.append(info_card("Rooms", " | ".join(rooms)))
+
+    return "".join(parts)
+
 
-    return summary
+def display_prediction(predicted_price, property_input, selected_features):
+    """Render the prediction card, property summary and location map"""
+    # Create property summary
+    summary_html = create_property_summary(property_input)
+
+    st.divider()
+
+    # Prediction result
+    price = format_currency(predicted_price)
+    st.html(
+        f'<div class="prediction-card"><h2>💰 Predicted Property Value</h2><h1>{price}</h1><p>Based on your input and current market conditions</p></div>'
+    )
+
+    # Property summary
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.subheader("📋 Property Summary")
+
+        # Summary cards and feature tags go out as a single element
+        html_parts = [summary_html]
+        if selected_features:
+            html_parts.append("<p><strong>Additional Features:</strong></p>")
+            html_parts.append(
+                "".join(
+                    f'<span class="feature-tag">{feature}</span>'
+                    for feature in selected_features
+                )
+            )
+        summary_block = "".join(html_parts)
+        if summary_block:
+            st.html(summary_block)
+
+    with col2:
+        # Map display
+        postcode = property_input["postCode"]
+        if postcode:
+            st.subheader("📍 Location")
+            lat, lon = get_location(postcode)
+
+            if lat and lon:
+                st.map({"lat": [lat], "lon": [lon]}, zoom=10)
+            else:
+                st.warning("⚠️ Could not display location on map")
 
 
 # Main app
 def main():
+    st.markdown(load_css(), unsafe_allow_html=True)
     st.html("<div class='main-header'><h1>Property Price Predictor</h1></div>")
 
-    # Server status check
-    with st.spinner("Checking server status..."):
-        status_message, is_connected = check_server_status()
-
-    if is_connected:
-        st.html(
-            f'<div class="status-container"><div class="status-good">✅ Server Status: {status_message}</div></div>'
-        )
-    else:
-        st.html(
-            f'<div class="status-container"><div class="status-error">❌ Server Status: {status_message}</div></div>'
-        )
-        st.warning(
-            "⚠️ The prediction service is currently unavailable. Please try again later."
-        )
-
-    list_apt = [
-       'Apartment', 'Flat Studio', 'Duplex', 'Penthouse', 'Ground Floor',
-    'Apartment Block', 'Kot', 'Exceptional Property', 'Mixed Use Building',
-    'Triplex', 'Loft', 'Service Flat'
-    ]
-    list_house = [
-       'House', 'Villa', 'Town House', 'Chalet', 'Manor House', 'Mansion',
-    'Bungalow', 'Country Cottage', 'Other Property', 'Castle', 'Pavilion',
-    'Exceptional Property'
-    ]
-    
-    list_type = ['Apartment', 'House']
+    # Server status check runs in the background while the form renders
+    status_future = get_executor().submit(check_server_status)
+    status_slot = st.container()
 
     st.subheader("🏡 Property Details")
 
@@ -257,25 +389,18 @@ def main():
     with col1:
         property_type_display = st.selectbox(
             "Property Type",
-            options= list_type,
+            options=LIST_TYPE,
             index=None,
             placeholder="Select property type...",
             key="property_type",
         )
 
     with col2:
-        if st.session_state.get("property_type") == "Apartment":
+        selected_type = st.session_state.get("property_type")
+        if selected_type in SUBTYPES:
             subtype_display = st.selectbox(
-                "Apartment Subtype",
-                options=[item.replace('_', ' ') for item in list_apt],
-                index=None,
-                placeholder="Select detailed subtype...",
-                key="subtype",
-            )
-        elif st.session_state.get("property_type") ==  "House":
-            subtype_display = st.selectbox(
-                "House Subtype",
-                options=[item.replace('_', ' ') for item in list_house],
+                f"{selected_type} Subtype",
+                options=SUBTYPES[selected_type],
                 index=None,
                 placeholder="Select detailed subtype...",
                 key="subtype",
@@ -303,9 +428,7 @@ def main():
         with col1:
             province_display = st.selectbox(
                 "Province",
-                options=[
-                    'Brussels', 'Luxembourg', 'Antwerp', 'Flemish Brabant', 'East Flanders', 'West Flanders', 'Liège', 'Walloon Brabant', 'Limburg', 'Namur', 'Hainaut'
-                ],
+                options=PROVINCES,
                 index=None,
                 placeholder="Select province...",
             )
@@ -325,7 +448,7 @@ def main():
 
         epc_score = st.selectbox(
             "EPC Score",
-            options=["A+", "A", "B", "C", "D", "E", "F", "G"],
+            options=EPC_SCORES,
             index=None,
             placeholder="Select EPC score...",
         )
@@ -366,49 +489,14 @@ def main():
         st.divider()
         st.subheader("✨ Additional Features")
 
-        boolean_fields = [
-            ("hasAttic", "Attic"),
-            ("hasGarden", "Garden"),
-            ("hasAirConditioning", "Air Conditioning"),
-            ("hasArmoredDoor", "Armored Door"),
-            ("hasVisiophone", "Visiophone"),
-            ("hasTerrace", "Terrace"),
-            ("hasOffice", "Office"),
-            ("hasSwimmingPool", "Swimming Pool"),
-            ("hasFireplace", "Fireplace"),
-            ("hasBasement", "Basement"),
-            ("hasDressingRoom", "Dressing Room"),
-            ("hasDiningRoom", "Dining Room"),
-            ("hasLift", "Lift"),
-            ("hasHeatPump", "Heat Pump"),
-            ("hasPhotovoltaicPanels", "Photovoltaic Panels"),
-            ("hasLivingRoom", "Living Room"),
-        ]
-        
-        property_type = format_for_api(property_type_display) if property_type_display else None
-        subtype = format_for_api(subtype_display) if subtype_display else None
-        province = province_display.replace(" ", "") if province_display else None
-        
-        property_input = {
-            "habitableSurface": habitableSurface,
-            "type": property_type,
-            "subtype": subtype,
-            "province": province,
-            "postCode": postcode,
-            "epcScore": epc_score,
-            "bedroomCount": bedroomCount,
-            "bathroomCount": bathroomCount,
-            "toiletCount": toiletCount,
-            "terraceSurface": terraceSurface,
-            "gardenSurface": gardenSurface,
-        }
-
+        features = {}
         selected_features = []
         cols = st.columns(4)
 
-        for i, (field_key, field_label) in enumerate(boolean_fields):
+        for i, (field_key, field_label) in enumerate(BOOLEAN_FIELDS):
             with cols[i % 4]:
                 checked = st.checkbox(field_label, key=field_key)
+                features[field_key] = checked
                 if checked:
                     selected_features.append(field_label)
 
@@ -421,69 +509,48 @@ def main():
                 "🔮 Predict Price", type="primary", use_container_width=True
             )
 
-        for field_key, _ in boolean_fields:
-            if st.session_state.get(field_key, False):
-                property_input[field_key] = True
-            else:
-                property_input[field_key] = False
-
     # Process form submission
     if submit_button:
+        st.session_state.pop("prediction", None)
+
+        # The payload is only needed when the form is submitted
+        property_type = format_for_api(property_type_display) if property_type_display else None
+        subtype = format_for_api(subtype_display) if subtype_display else None
+        province = province_display.replace(" ", "") if province_display else None
+
+        property_input = {
+            "habitableSurface": habitableSurface,
+            "type": property_type,
+            "subtype": subtype,
+            "province": province,
+            "postCode": postcode,
+            "epcScore": epc_score,
+            "bedroomCount": bedroomCount,
+            "bathroomCount": bathroomCount,
+            "toiletCount": toiletCount,
+            "terraceSurface": terraceSurface,
+            "gardenSurface": gardenSurface,
+            **features,
+        }
+
         with st.spinner("🔄 Processing your request..."):
             try:
-                response = predict_price(property_input)
-                
-                if response is None:
+                status_code, body = predict_price(property_input)
+
+                if status_code is None:
                     pass
-                elif response.status_code == 200:
-                    response = response.json()
-                    prediction = response["data"]
-
-                    # Create property summary
-                    summary = create_property_summary(property_input)
-
-                    st.divider()
-
-                    # Prediction result
-                    st.html(
-                        f'<div class="prediction-card"><h2>💰 Predicted Property Value</h2><h1>{format_currency(prediction['prediction'])}</h1><p>Based on your input and current market conditions</p></div>'
-                    )
-
-                    # Property summary
-                    col1, col2 = st.columns([2, 1])
-
-                    with col1:
-                        st.subheader("📋 Property Summary")
-
-                        for key, value in summary.items():
-                            st.html(
-                                f'<div class="info-card"><strong>{key}:</strong> {value}</div>'
-                            )
-
-                        if len(selected_features) > 0:
-                            st.write("**Additional Features:**")
-                            features_html = ""
-                            for feature in selected_features:
-                                features_html += (
-                                    f'<span class="feature-tag">{feature}</span>'
-                                )
-                            st.html(features_html)
-
-                    with col2:
-                        # Map display
-                        if postcode:
-                            st.subheader("📍 Location")
-                            lat, lon = get_location(postcode)
-
-                            if lat and lon:
-                                location_df = pd.DataFrame([{"lat": lat,"lon": lon,}])
-                                st.map(location_df, zoom=10)
-                            else:
-                                st.warning("⚠️ Could not display location on map")
-
-                elif response.status_code == 422:
-                    detail = response.json().get("detail", [])
-                    if detail:
+                elif status_code == 200:
+                    predicted_price = extract_price(body)
+                    if predicted_price is None:
+                        st.error("⛔ Unexpected response from the prediction service")
+                    else:
+                        st.session_state["prediction"] = predicted_price
+                        st.session_state["last_payload"] = property_input
+                        st.session_state["selected_features"] = selected_features
+                elif status_code == 422:
+                    # Non-JSON bodies come back as plain text
+                    detail = body.get("detail") if isinstance(body, dict) else None
+                    if isinstance(detail, list) and detail and isinstance(detail[0], dict):
                         error = detail[0]
                         loc = error.get("loc", [])
                         msg = error.get("msg", "Unknown error")
@@ -495,15 +562,57 @@ def main():
                             st.error(f"{msg}")
                     else:
                         st.error("⚠️ Unknown error occurred")
-                elif response.status_code == 500:
-                    error = response.json()["error"]
-                    st.error(f"⛔ {error}")
+                elif status_code == 500 and isinstance(body, dict) and "error" in body:
+                    st.error(f"⛔ {body['error']}")
                 else:
-                    st.error(f"⛔ API Error: {response.status_code} - {response.text}")
-
-            except Exception as e:
+                    st.error(f"⛔ API Error: {status_code} - {body}")
+
+            except requests.exceptions.Timeout:
+                st.error(
+                    "⏳ The prediction service took too long to respond. It may be waking up, please try again in a moment."
+                )
+            except (
+                requests.exceptions.RequestException,
+                ValueError,
+                KeyError,
+                TypeError,
+            ) as e:
                 st.error(f"❌ An unexpected error occurred: {str(e)}")
 
+    # Keep the last result on screen across reruns triggered by other widgets
+    if "prediction" in st.session_state:
+        display_prediction(
+            st.session_state["prediction"],
+            st.session_state["last_payload"],
+            st.session_state["selected_features"],
+        )
+
+    # Fill the banner last so neither the submit nor a stored result waits on the probe
+    with status_slot:
+        try:
+            with st.spinner("Checking server status..."):
+                status_message, is_connected = status_future.result(
+                    timeout=STATUS_JOIN_TIMEOUT
+                )
+        except FutureTimeoutError:
+            # The probe keeps running and its cached result shows on the next rerun
+            st.html(
+                '<div class="status-container"><div class="status-pending">⏳ Server Status: still checking...</div></div>'
+            )
+        else:
+            if is_connected:
+                st.html(
+                    f'<div class="status-container"><div class="status-good">✅ Server Status: {status_message}</div></div>'
+                )
+            else:
+                st.html(
+                    f'<div class="status-container"><div class="status-error">❌ Server Status: {status_message}</div></div>'
+                )
+                st.warning(
+                    "⚠️ The prediction service is currently unavailable. Please try again later."
+                )
+                st.button("🔄 Recheck server", on_click=check_server_status.clear)
+
 
 if __name__ == "__main__":
     main()